@@ -1,10 +1,130 @@
 import json
 import logging
 import os
+import threading
+import time
+from array import array
 from datetime import datetime
-from collections import defaultdict
+from collections import deque
+from enum import IntEnum
 from pynput import keyboard, mouse
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class EventType(IntEnum):
+    """Index of each counter in the statistics array."""
+
+    KEYBOARD_PRESS = 0
+    KEYBOARD_RELEASE = 1
+    MOUSE_MOVE = 2
+    MOUSE_CLICK_LEFT = 3
+    MOUSE_CLICK_RIGHT = 4
+    MOUSE_CLICK_MIDDLE = 5
+    MOUSE_CLICK_OTHER = 6
+    MOUSE_SCROLL = 7
+
+
+# Keys used when the counters are reported, e.g. 'mouse_click_left'
+_STAT_NAMES = tuple(event.name.lower() for event in EventType)
+
+# Display name and counter for each common mouse button
+_BUTTONS = {
+    mouse.Button.left: ('left', EventType.MOUSE_CLICK_LEFT),
+    mouse.Button.right: ('right', EventType.MOUSE_CLICK_RIGHT),
+    mouse.Button.middle: ('middle', EventType.MOUSE_CLICK_MIDDLE)
+}
+
+# Message templates for the listener callbacks, resolved once per event type
+_KEY_PRESS_MESSAGE = "[KEYBOARD] Key pressed: %s"
+_KEY_RELEASE_MESSAGE = "[KEYBOARD] Released %s"
+_MOVE_MESSAGE = "[MOUSE] Mouse moved to position: (%s, %s) [%d samples in %d ms]"
+_CLICK_MESSAGES = {
+    True: "[MOUSE] Button %s pressed at position (%s, %s)",
+    False: "[MOUSE] Button %s released at position (%s, %s)"
+}
+_SCROLL_MESSAGES = {
+    True: "[MOUSE] Mouse scrolled up at position (%s, %s)",
+    False: "[MOUSE] Mouse scrolled down at position (%s, %s)"
+}
+
+
+def _json_default(obj):
+    # Fallback path only: orjson serializes datetime natively.
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler that writes through a large buffer.
+
+    While flush_on_emit is False, records are not flushed individually and the
+    owner is expected to call flush() periodically, so bursts of records reach
+    the disk in a few large writes. Otherwise it behaves like FileHandler.
+    """
+
+    def __init__(self, filename, encoding=None, buffer_size=65536):
+        self.buffer_size = buffer_size
+        self.flush_on_emit = True
+        super().__init__(filename, encoding=encoding)
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size, encoding=self.encoding)
+
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if self.flush_on_emit:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that reuses the rendered timestamp for records in the same second.
+
+    Only valid for a datefmt without sub-second fields; without a datefmt the
+    default formatting (which appends milliseconds) is used for every record.
+    """
+
+    def __init__(self, fmt=None, datefmt=None):
+        super().__init__(fmt, datefmt)
+        self._cached_time = (None, None)
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        cached_second, cached_text = self._cached_time
+        if second != cached_second:
+            cached_text = super().formatTime(record, datefmt)
+            self._cached_time = (second, cached_text)
+        return cached_text
+
+
+class _QueuedEvent:
+    """Reusable slot for an event waiting to be written by the flush thread."""
+
+    __slots__ = ('level', 'message', 'args', 'ticks')
+
+    def __init__(self):
+        self.level = logging.NOTSET
+        self.message = None
+        self.args = None
+        self.ticks = 0
+
 
 class Logger:
     """
@@ -25,15 +145,25 @@ class Logger:
         'CRITICAL': logging.CRITICAL
     }
 
-    def __init__(self, log_dir='logs', log_level='INFO'):
+    EXPORT_BUFFER_SIZE = 65536
+    FLUSH_INTERVAL = 0.05
+    FILE_FLUSH_INTERVAL = 1.0
+    EVENT_POOL_SIZE = 4096
+    RECENT_EVENTS_LIMIT = 50
+
+    # A mouse move is logged once the cursor travels this far (px) or the window (s) elapses
+    MOVE_MIN_DISTANCE = 8
+    MOVE_WINDOW = 0.1
+
+    def __init__(self, log_dir='logs', log_level='INFO', console_level='WARNING'):
         self.log_dir = log_dir
         self.log_level = log_level
+        self.console_level = console_level
         self.is_running = False
-        self.stats = defaultdict(int)
+        self._stats = array('Q', [0] * len(EventType))
         self.session_start = None
 
-        if not os.path.exists(self.log_dir):
-            os.makedirs(self.log_dir)
+        os.makedirs(self.log_dir, exist_ok=True)
 
         # Logger setup
         self._setup_logger()
@@ -42,6 +172,24 @@ class Logger:
         self.keyboard_listener = None
         self.mouse_listener = None
 
+        # Events queued by the listener callbacks and written by the flush thread
+        self._log_queue = deque()
+
+        # Preallocated slots reused by the queue
+        self._free_records = deque((_QueuedEvent() for _ in range(self.EVENT_POOL_SIZE)),
+                                   maxlen=self.EVENT_POOL_SIZE)
+        self._flush_stop = threading.Event()
+        self._flush_thread = None
+        self._clock_offset_ns = time.time_ns() - time.monotonic_ns()
+
+        # Mouse moves not yet logged; shared by the mouse listener and the flush thread
+        self._move_lock = threading.Lock()
+        self._last_move_xy = (0, 0)
+        self._pending_move_xy = None
+        self._move_window_start = 0.0
+        self._move_window_last = 0.0
+        self._move_count = 0
+
         # Init filters
         self.filters = {
             'keyboard': True,
@@ -55,29 +203,41 @@ class Logger:
         self.stop_key = keyboard.Key.esc
         self.stop_on_hotkey = False
 
+        # str() of special keys (Key.shift, ...), filled on first use
+        self._key_names = {}
+
     def _setup_logger(self):
         timestamp = datetime.now().strftime('%d-%m-%Y_%H-%M-%S')
         log_filename = os.path.join(self.log_dir, f'user_actions_{timestamp}.log')
 
-        formatter = logging.Formatter(
+        formatter = CachedTimeFormatter(
             '%(asctime)s | %(levelname)-8s | %(message)s',
             datefmt='%d-%m-%Y %H:%M:%S'
         )
 
-        file_handler = logging.FileHandler(log_filename, encoding='utf-8')
+        file_handler = BufferedFileHandler(log_filename, encoding='utf-8')
         file_handler.setFormatter(formatter)
 
+        # Only warnings reach the console by default; the file gets everything
         console_handler = logging.StreamHandler()
+        console_handler.setLevel(self.LOG_LEVELS[self.console_level])
         console_handler.setFormatter(formatter)
 
         self.logger = logging.getLogger('UserActionLogger')
         self.logger.setLevel(self.LOG_LEVELS[self.log_level])
+
+        # The named logger is shared, so release the previous session's file
+        for handler in self.logger.handlers:
+            handler.close()
         self.logger.handlers.clear()
         self.logger.addHandler(file_handler)
         self.logger.addHandler(console_handler)
 
+        self._file_handler = file_handler
         self.current_log_file = log_filename
-        self.recent_events = []
+        # (sequence number, text) pairs; the number lets viewers pick up only new entries
+        self.recent_events = deque(maxlen=self.RECENT_EVENTS_LIMIT)
+        self._event_seq = 0
 
         self.logger.info("=" * 70)
         self.logger.info("NEW LOG SESSION STARTED:")
@@ -85,77 +245,162 @@ class Logger:
         self.logger.info(f"Log file: {log_filename}")
         self.logger.info("=" * 70)
 
-    def _add_event(self, message):
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        event = f"[{timestamp}] {message}"
-        self.recent_events.append(event)
+    def _add_event(self, timestamp, message):
+        # The deque drops the oldest event once the limit is reached
+        self._event_seq += 1
+        self.recent_events.append((self._event_seq, f"[{timestamp}] {message}"))
 
-        if len(self.recent_events) > 100:
-            self.recent_events.pop(0)
+    def _queue_event(self, level, message, *args):
+        # Formatting, level checks and wall-clock conversion are left to the flush thread
+        try:
+            entry = self._free_records.pop()
+        except IndexError:
+            entry = _QueuedEvent()
+
+        entry.level = level
+        entry.message = message
+        entry.args = args
+        entry.ticks = time.monotonic_ns()
+        self._log_queue.append(entry)
+
+    def _drain_log_queue(self):
+        queue = self._log_queue
+        free_records = self._free_records
+        logger = self.logger
+        clock_offset = self._clock_offset_ns
+        label_second = None
+        label = None
+
+        while queue:
+            entry = queue.popleft()
+            level, message, args, ticks = entry.level, entry.message, entry.args, entry.ticks
+            entry.args = None
+            free_records.append(entry)
+
+            # A bad event must not stop the flush thread
+            try:
+                message = message % args
+                created = (ticks + clock_offset) / 1e9
+
+                # Events below the log level still go to the recent-events panel
+                if logger.isEnabledFor(level):
+                    record = logger.makeRecord(logger.name, level, '(unknown file)', 0, message, None, None)
+                    record.created = created
+                    record.msecs = (created - int(created)) * 1000
+                    logger.handle(record)
+            except Exception as e:
+                logger.error(f"[LOGGER] Error occurred while writing queued event: {e}")
+                continue
+
+            # Events in the same second share one formatted label
+            second = int(created)
+            if second != label_second:
+                label_second = second
+                label = time.strftime('%H:%M:%S', time.localtime(second))
+            self._add_event(label, message)
+
+    def _flush_handlers(self):
+        for handler in self.logger.handlers:
+            handler.flush()
+
+    def _flush_loop(self):
+        last_flush = time.monotonic()
+        while not self._flush_stop.wait(self.FLUSH_INTERVAL):
+            self._flush_pending_move(expired_only=True)
+            self._drain_log_queue()
+
+            now = time.monotonic()
+            if now - last_flush >= self.FILE_FLUSH_INTERVAL:
+                self._flush_handlers()
+                last_flush = now
+        self._drain_log_queue()
+
+    def _key_name(self, key):
+        char = getattr(key, 'char', None)
+        if char is not None:
+            return char
+
+        name = self._key_names.get(key)
+        if name is None:
+            name = self._key_names[key] = str(key)
+        return name
 
     def _on_press(self, key):
         if self.stop_on_hotkey and key == self.stop_key:
-            self.logger.warning(f"[STOP] Pressed {self.stop_key} - stop logging.")
+            self._queue_event(logging.WARNING, "[STOP] Pressed %s - stop logging.", self.stop_key)
             self.stop()
             return False
 
         if not self.filters['keyboard']:
             return
 
-        try:
-            key_name = key.char if hasattr(key, 'char') else str(key)
-            message = f"[KEYBOARD] Key pressed: {key_name}"
-            self.logger.info(message)
-            self._add_event(message)
-            self.stats['keyboard_press'] += 1
-        except Exception as e:
-            self.logger.error(f"[KEYBOARD] Error occurred while processing key press: {e}")
+        self._stats[EventType.KEYBOARD_PRESS] += 1
+        self._queue_event(logging.INFO, _KEY_PRESS_MESSAGE, self._key_name(key))
 
     def _on_release(self, key):
-        if not self.filters.get('keyboard_release', False):
+        if not self.filters['keyboard_release']:
             return
 
-        try:
-            key_name = key.char if hasattr(key, 'char') else str(key)
-            message = f"[KEYBOARD] Released {key_name}"
-            self.logger.debug(message)
-            self._add_event(message)
-            self.stats['keyboard_release'] += 1
-
-        except Exception as e:
-            self.logger.error(f"[KEYBOARD] Error occurred while processing key release: {e}")
+        self._stats[EventType.KEYBOARD_RELEASE] += 1
+        self._queue_event(logging.DEBUG, _KEY_RELEASE_MESSAGE, self._key_name(key))
 
     def _on_move(self, x, y):
         if not self.filters['mouse_move']:
             return
 
-        message = f"[MOUSE] Mouse moved to position: ({x}, {y})"
-        self.logger.debug(message)
-        self._add_event(message)
-        self.stats['mouse_move'] += 1
+        self._stats[EventType.MOUSE_MOVE] += 1
+
+        now = time.monotonic()
+        with self._move_lock:
+            if self._move_count == 0:
+                self._move_window_start = now
+            self._move_count += 1
+            self._move_window_last = now
+            self._pending_move_xy = (x, y)
+
+            last_x, last_y = self._last_move_xy
+            if ((x - last_x) ** 2 + (y - last_y) ** 2 > self.MOVE_MIN_DISTANCE ** 2
+                    or now - self._move_window_start >= self.MOVE_WINDOW):
+                self._emit_pending_move()
+
+    def _emit_pending_move(self):
+        # Caller holds _move_lock and has at least one pending sample
+        x, y = self._pending_move_xy
+        elapsed = self._move_window_last - self._move_window_start
+        self._queue_event(logging.DEBUG, _MOVE_MESSAGE, x, y, self._move_count, elapsed * 1000)
+        self._last_move_xy = (x, y)
+        self._pending_move_xy = None
+        self._move_count = 0
+
+    def _flush_pending_move(self, expired_only=False):
+        # Close the current window so its samples are not held back by an idle cursor
+        with self._move_lock:
+            if not self._move_count:
+                return
+            if expired_only and time.monotonic() - self._move_window_start < self.MOVE_WINDOW:
+                return
+            self._emit_pending_move()
 
     def _on_click(self, x, y, button, pressed):
         if not self.filters['mouse_click']:
             return
 
-        action = "pressed" if pressed else "released"
-        button_name = str(button).replace('Button.', '')
-        message = f"[MOUSE] Button {button_name} {action} at position ({x}, {y})"
-        self.logger.info(message)
-        self._add_event(message)
+        button_info = _BUTTONS.get(button)
+        if button_info is None:
+            button_info = (str(button).replace('Button.', ''), EventType.MOUSE_CLICK_OTHER)
 
+        button_name, event_type = button_info
         if pressed:
-            self.stats[f'mouse_click_{button_name}'] += 1
+            self._stats[event_type] += 1
+
+        self._queue_event(logging.INFO, _CLICK_MESSAGES[pressed], button_name, x, y)
 
     def _on_scroll(self, x, y, dx, dy):
         if not self.filters['mouse_scroll']:
             return
 
-        direction = "up" if dy > 0 else "down"
-        message = f"[MOUSE] Mouse scrolled {direction} at position ({x}, {y})"
-        self.logger.info(message)
-        self._add_event(message)  # ДОДАНО
-        self.stats['mouse_scroll'] += 1
+        self._stats[EventType.MOUSE_SCROLL] += 1
+        self._queue_event(logging.INFO, _SCROLL_MESSAGES[dy > 0], x, y)
 
     def start(self):
         if self.is_running:
@@ -164,10 +409,20 @@ class Logger:
 
         self.is_running = True
         self.session_start = datetime.now()
-        self.stats.clear()
+        self._stats = array('Q', [0] * len(EventType))
         self.recent_events.clear()
+        self._last_move_xy = (0, 0)
+        self._pending_move_xy = None
+        self._move_count = 0
         self.logger.info("[INFO] Logger started.")
 
+        # Start the background writer before any events can be queued
+        self._clock_offset_ns = time.time_ns() - time.monotonic_ns()
+        self._flush_stop.clear()
+        self._file_handler.flush_on_emit = False
+        self._flush_thread = threading.Thread(target=self._flush_loop, name='UserActionLoggerFlush', daemon=True)
+        self._flush_thread.start()
+
         # Start listeners
         self.keyboard_listener = keyboard.Listener(
             on_press=self._on_press,
@@ -195,17 +450,37 @@ class Logger:
         if self.mouse_listener:
             self.mouse_listener.stop()
 
+        # Write out whatever the callbacks queued before stopping
+        self._flush_pending_move()
+        self._flush_stop.set()
+        if self._flush_thread:
+            self._flush_thread.join()
+            self._flush_thread = None
+
         self._log_statistics()
         self.logger.info("[INFO] Logger stopped.")
         self.logger.info("=" * 70)
 
+        # Nothing flushes periodically any more, so later records (export, filters) go out at once
+        self._flush_handlers()
+        self._file_handler.flush_on_emit = True
+
+    @property
+    def stats(self):
+        """Non-zero event counters keyed by name, e.g. {'keyboard_press': 12}."""
+        return {name: count for name, count in zip(_STAT_NAMES, self._stats) if count}
+
+    @property
+    def total_events(self):
+        return sum(self._stats)
+
     def _log_statistics(self):
         if self.session_start:
             duration = datetime.now() - self.session_start
             self.logger.info("\n" + "=" * 70)
             self.logger.info("[STATISTICS] Session statistics:")
             self.logger.info(f"Total duration: {duration}")
-            self.logger.info(f"Total events: {sum(self.stats.values())}")
+            self.logger.info(f"Total events: {self.total_events}")
 
             for event_type, count in sorted(self.stats.items()):
                 self.logger.info(f"  • {event_type}: {count}")
@@ -233,15 +508,21 @@ class Logger:
             filename = os.path.join(self.log_dir, f'stats_{timestamp}.json')
 
         stats_data = {
-            'session_start': self.session_start.isoformat() if self.session_start else None,
-            'session_duration': str(datetime.now() - self.session_start) if self.session_start else None,
+            'session_start': self.session_start,
+            'session_duration': (datetime.now() - self.session_start).total_seconds() if self.session_start else None,
             'log_level': self.log_level,
             'filters': self.filters,
-            'statistics': dict(self.stats)
+            'statistics': self.stats
         }
 
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(stats_data, f, indent=4, ensure_ascii=False)
+        # Both paths produce the same 2-space layout (the only indent orjson supports)
+        if orjson is not None:
+            with open(filename, 'wb', buffering=self.EXPORT_BUFFER_SIZE) as f:
+                f.write(orjson.dumps(stats_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            # json.dump encodes incrementally, so chunks go straight to the buffered file.
+            with open(filename, 'w', encoding='utf-8', buffering=self.EXPORT_BUFFER_SIZE) as f:
+                json.dump(stats_data, f, indent=2, ensure_ascii=False, default=_json_default)
 
         self.logger.info(f"[Export] Statistic exported to JSON: {filename}")
 
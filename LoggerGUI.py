@@ -57,6 +57,10 @@ class LoggerGUI:
                                        width=15, state='readonly')
         log_level_combo.pack(side=tk.LEFT, padx=5)
 
+        self.console_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(level_frame, text="🖥️ Echo events to console",
+                        variable=self.console_var).pack(side=tk.LEFT, padx=15)
+
         # Actions filters
         filter_frame = ttk.LabelFrame(self.root, text="🔍 Actions filters", padding=10)
         filter_frame.pack(fill=tk.X, padx=10, pady=5)
@@ -102,9 +106,23 @@ class LoggerGUI:
         stats_frame = ttk.LabelFrame(self.root, text="📊 Current session statistics", padding=10)
         stats_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
 
-        self.stats_text = scrolledtext.ScrolledText(stats_frame, height=10,
-                                                    font=('Consolas', 10))
-        self.stats_text.pack(fill=tk.BOTH, expand=True)
+        self.session_info_var = tk.StringVar(value="")
+        ttk.Label(stats_frame, textvariable=self.session_info_var,
+                  font=('Consolas', 10)).pack(fill=tk.X)
+
+        self.stats_tree = ttk.Treeview(stats_frame, columns=('event', 'count'),
+                                       show='headings', height=8)
+        self.stats_tree.heading('event', text="Event", anchor=tk.W)
+        self.stats_tree.heading('count', text="Count", anchor=tk.E)
+        self.stats_tree.column('event', anchor=tk.W)
+        self.stats_tree.column('count', width=100, anchor=tk.E)
+        self.stats_tree.tag_configure('total', font=('Consolas', 10, 'bold'))
+        self.stats_tree.pack(fill=tk.BOTH, expand=True)
+
+        # Counts currently shown per event row
+        self._stat_counts = {}
+        self._last_total = None
+        self.reset_statistics_view()
 
         # Останні події
         events_frame = ttk.LabelFrame(self.root, text="📝 Recent events", padding=10)
@@ -113,6 +131,7 @@ class LoggerGUI:
         self.events_text = scrolledtext.ScrolledText(events_frame, height=15,
                                                      font=('Consolas', 9))
         self.events_text.pack(fill=tk.BOTH, expand=True)
+        self._last_event_seq = 0
 
         # Status bar
         self.status_var = tk.StringVar(value="Ready to work.")
@@ -129,7 +148,8 @@ class LoggerGUI:
     def start_logging(self):
         try:
             log_level = self.log_level_var.get()
-            self.logger = Logger(log_level=log_level)
+            console_level = log_level if self.console_var.get() else 'WARNING'
+            self.logger = Logger(log_level=log_level, console_level=console_level)
 
             # Application of filters
             for key, var in self.filter_vars.items():
@@ -145,7 +165,11 @@ class LoggerGUI:
             self.status_var.set("🟢 Logging is active")
 
             # Start updating statistics
+            self.reset_statistics_view()
             self.update_statistics()
+
+            self.events_text.delete(1.0, tk.END)
+            self._last_event_seq = 0
             self.update_events()
 
         except Exception as e:
@@ -185,35 +209,56 @@ class LoggerGUI:
         if key_name in key_map:
             self.logger.set_stop_key(key_map[key_name])
 
+    def reset_statistics_view(self):
+        self.stats_tree.delete(*self.stats_tree.get_children())
+        self._stat_counts.clear()
+        self._last_total = None
+        self.stats_tree.insert('', tk.END, iid='total', values=("TOTAL", 0), tags=('total',))
+
     def update_statistics(self):
         if self.logger and self.logger.is_running:
-            self.stats_text.delete(1.0, tk.END)
-
-            stats_info = f"Start time: {self.logger.session_start.strftime('%H:%M:%S')}\n"
-            stats_info += f"Duration: {datetime.now() - self.logger.session_start}\n"
-            stats_info += f"Logging level: {self.logger.log_level}\n\n"
-            stats_info += "EVENTS:\n"
-            stats_info += "-" * 40 + "\n"
-
-            for event_type, count in sorted(self.logger.stats.items()):
-                stats_info += f"{event_type:.<30} {count:>5}\n"
-
-            stats_info += "-" * 40 + "\n"
-            stats_info += f"{'TOTAL:':.<30} {sum(self.logger.stats.values()):>5}\n"
-
-            self.stats_text.insert(1.0, stats_info)
+            start = self.logger.session_start
+            self.session_info_var.set(
+                f"Start time: {start.strftime('%H:%M:%S')}    "
+                f"Duration: {datetime.now() - start}    "
+                f"Logging level: {self.logger.log_level}"
+            )
+
+            # Counters only grow, so an unchanged total means nothing to redraw
+            total = self.logger.total_events
+            if total != self._last_total:
+                self._last_total = total
+
+                # Touch only the rows whose count changed; new rows keep the list sorted
+                for event_type, count in self.logger.stats.items():
+                    shown = self._stat_counts.get(event_type)
+                    if shown is None:
+                        index = sorted([*self._stat_counts, event_type]).index(event_type)
+                        self.stats_tree.insert('', index, iid=event_type, values=(event_type, count))
+                    elif shown != count:
+                        self.stats_tree.set(event_type, 'count', count)
+                    self._stat_counts[event_type] = count
+
+                self.stats_tree.set('total', 'count', total)
 
             # Planning for the next update
             self.root.after(1000, self.update_statistics)
 
     def update_events(self):
         if self.logger and self.logger.is_running:
-            self.events_text.delete(1.0, tk.END)
-
-            events = list(reversed(self.logger.recent_events[-50:]))
-            self.events_text.insert(1.0, '\n'.join(events))
-
-            self.events_text.see(1.0)
+            # Insert only events added since the last tick, newest on top
+            events = list(self.logger.recent_events)
+            if events and events[-1][0] > self._last_event_seq:
+                new_events = [text for seq, text in events if seq > self._last_event_seq]
+                text = '\n'.join(reversed(new_events))
+                if self._last_event_seq:
+                    text += '\n'
+                self.events_text.insert(1.0, text)
+                self._last_event_seq = events[-1][0]
+
+                # Drop lines beyond the number of events the logger keeps
+                self.events_text.delete(f'{self.logger.RECENT_EVENTS_LIMIT}.end', tk.END)
+                self.events_text.see(1.0)
 
             self.root.after(500, self.update_events)
 